@@ -115,12 +115,24 @@ def add_language_codes(data, lang, isocode, glottocodes=None, glottocode=None):
             language=lang, identifier=identifier('glottolog', glottocode)))
 
 
+# Field values - in particular author and editor names, journals, publishers - recur a lot
+# in bibliographies, so we memoize de-TeXing them.
+_unescape = functools.lru_cache(maxsize=2 ** 17)(bibtex.unescape)
+
+
+@functools.lru_cache(maxsize=None)
+def _bibtex_fields(cls):
+    """The BibTeX fields which are stored as attributes of model class `cls`."""
+    return frozenset(field for field in bibtex.FIELDS if hasattr(cls, field))
+
+
 def bibtex2source(rec, cls=common.Source, lowercase_id=False):
-    year, fields, jsondata = bibtex.unescape(rec.get('year', 'nd')), {}, {}
+    year, fields, jsondata = _unescape(rec.get('year', 'nd')), {}, {}
+    cls_fields = _bibtex_fields(cls)
     for field in bibtex.FIELDS:
         if field in rec:
-            value = bibtex.unescape(rec[field])
-            container = fields if hasattr(cls, field) else jsondata
+            value = _unescape(rec[field])
+            container = fields if field in cls_fields else jsondata
             container[field] = value
 
     etal, eds = '', ''
@@ -130,7 +142,7 @@ def bibtex2source(rec, cls=common.Source, lowercase_id=False):
         if authors:
             eds = ' (eds.)'
     if authors:
-        authors = bibtex.unescape(authors).split(' and ')
+        authors = _unescape(authors).split(' and ')
         if len(authors) > 2:
             authors = authors[:1]
             etal = ' et al.'
@@ -141,7 +153,7 @@ def bibtex2source(rec, cls=common.Source, lowercase_id=False):
     return cls(
         id=slug(rec.id, lowercase=lowercase_id),
         name=('%s %s' % (authors, year)).strip(),
-        description=bibtex.unescape(rec.get('title', rec.get('booktitle', ''))),
+        description=_unescape(rec.get('title', rec.get('booktitle', ''))),
         jsondata=jsondata,
         bibtex_type=rec.genre,
         **fields)
@@ -162,31 +174,57 @@ class Data(collections.defaultdict):
     >>> data = Data()
     >>> l = data.add(common.Language, 'l', id='abc', name='Abc Language')
     >>> assert l == data['Language']['l']
+
+    For big imports, new objects can be passed to the session in batches, by specifying a
+    ``buffer_size``. Objects are then added to the session - and the session is flushed -
+    whenever ``buffer_size`` objects of a model class have been collected. Remaining
+    objects must be added by calling :meth:`Data.flush` at the end of the import.
+
+    Objects which will not be looked up later - e.g. the values of a big dataset - can be
+    added with key ``None``. Such objects are not stored in the ``Data`` instance, thus
+    can be garbage collected once they are flushed to the database.
     """
 
-    def __init__(self, **kw):
+    def __init__(self, buffer_size=0, **kw):
         super(Data, self).__init__(dict)
         self.defaults = kw
+        self.buffer_size = buffer_size
+        self._pending = collections.defaultdict(list)
 
     def add(self, model_, key_, **kw):
         """
         Create an instance of a model class to be persisted in the database.
 
         :param model_: The model class we want to create an instance of.
-        :param key_: A key which can be used to retrieve the instance later.
+        :param key_: A key which can be used to retrieve the instance later, or `None` if \
+        the instance should not be stored for lookup.
         :param kw: Keyword parameters passed to model class for initialisation.
         :return: The newly created instance of model class.
         """
         if '.' in kw.get('id', ''):
             raise ValueError('Object id contains illegal character "."')
-        if list(kw.keys()) == ['_obj']:
+        if len(kw) == 1 and '_obj' in kw:
             # if a single keyword parameter _obj is passed, we take it to be the object
             # which should be added to the session.
             new = kw['_obj']
         else:
-            for k, v in self.defaults.items():
-                kw.setdefault(k, v)
-            new = model_(**kw)
-        self[model_.__name__][key_] = new
-        DBSession.add(new)
+            new = model_(**dict(self.defaults, **kw)) if self.defaults else model_(**kw)
+        if key_ is not None:
+            self[model_.__name__][key_] = new
+        if self.buffer_size:
+            pending = self._pending[model_.__name__]
+            pending.append(new)
+            if len(pending) >= self.buffer_size:
+                self._flush(model_.__name__)
+        else:
+            DBSession.add(new)
         return new
+
+    def _flush(self, name):
+        DBSession.add_all(self._pending.pop(name))
+        DBSession.flush()
+
+    def flush(self):
+        """Add all buffered objects to the session and flush it."""
+        for name in list(self._pending):
+            self._flush(name)
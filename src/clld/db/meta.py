@@ -1,4 +1,5 @@
 """We provide some infrastructure to build extensible database models."""
+import os
 import json
 import sqlite3
 
@@ -48,6 +49,20 @@ def ping_connection(dbapi_connection, connection_record, connection_proxy):
 DBSession = scoped_session(sessionmaker())
 zope.sqlalchemy.register(DBSession)
 
+#: If the environment variable ``CLLD_STRICT_LOADS`` is set, collections which are
+#: configured with :func:`lazy` raise an exception when lazy-loaded, rather than silently
+#: emitting one query per parent object.
+STRICT_LOADS = bool(os.environ.get('CLLD_STRICT_LOADS'))
+
+
+def lazy(strategy='select'):
+    """Loader strategy for relationships which should be eager-loaded where it matters.
+
+    :param strategy: The loader strategy to use when not in strict mode.
+    :return: ``'raise'`` in strict mode, ``strategy`` otherwise.
+    """
+    return 'raise' if STRICT_LOADS else strategy
+
 
 class JSONEncodedDict(TypeDecorator):
 
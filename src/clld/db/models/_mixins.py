@@ -54,9 +54,14 @@ class FilesMixin(IdNameDescriptionMixin):
         filesystem, e.g. using the create method.
     """
 
+    def __init_subclass__(cls, **kw):
+        # The name of the owner class is derived from the class name just once:
+        cls._owner_class = cls.__name__.split('_')[0]
+        super().__init_subclass__(**kw)
+
     @classmethod
     def owner_class(cls):
-        return cls.__name__.split('_')[0]
+        return cls._owner_class
 
     ord = Column(Integer, default=1)
     """Ordinal to control sorting of files associated with one db object."""
@@ -66,7 +71,7 @@ class FilesMixin(IdNameDescriptionMixin):
 
     @declared_attr
     def object_pk(cls):
-        return Column(Integer, ForeignKey('%s.pk' % cls.owner_class().lower()))
+        return Column(Integer, ForeignKey('%s.pk' % cls.owner_class().lower()), index=True)
 
     @property
     def relpath(self):
@@ -92,20 +97,24 @@ class HasFilesMixin(object):
     @property
     def files(self):
         """return ``dict`` of associated files keyed by ``id``."""
-        return dict((f.id, f) for f in self._files)
+        return {f.id: f for f in self._files}
 
     @declared_attr
     def _files(cls):
-        return relationship(cls.__name__ + '_files', backref='object')
+        return relationship(cls.__name__ + '_files', backref='object', lazy='selectin')
 
 
 class DataMixin(object):
 
     """Provide a simple way to attach key-value pairs to a model class given by name."""
 
+    def __init_subclass__(cls, **kw):
+        cls._owner_class = cls.__name__.split('_')[0]
+        super().__init_subclass__(**kw)
+
     @classmethod
     def owner_class(cls):
-        return cls.__name__.split('_')[0]
+        return cls._owner_class
 
     key = Column(Unicode)
     value = Column(Unicode)
@@ -113,7 +122,7 @@ class DataMixin(object):
 
     @declared_attr
     def object_pk(cls):
-        return Column(Integer, ForeignKey('%s.pk' % cls.owner_class().lower()))
+        return Column(Integer, ForeignKey('%s.pk' % cls.owner_class().lower()), index=True)
 
 
 class HasDataMixin(object):
@@ -129,8 +138,9 @@ class HasDataMixin(object):
 
     def datadict(self):
         """return ``dict`` of associated key-value pairs."""
-        return dict((d.key, d.value) for d in self.data)
+        return {d.key: d.value for d in self.data}
 
     @declared_attr
     def data(cls):
-        return relationship(cls.__name__ + '_data', order_by=cls.__name__ + '_data.ord')
+        return relationship(
+            cls.__name__ + '_data', order_by=cls.__name__ + '_data.ord', lazy='selectin')
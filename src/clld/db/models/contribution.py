@@ -1,9 +1,11 @@
+from operator import attrgetter
+
 from sqlalchemy import Column, Integer, Boolean, Date, ForeignKey, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, backref
 
 from zope.interface import implementer
 
-from clld.db.meta import Base, PolymorphicBaseMixin
+from clld.db.meta import Base, PolymorphicBaseMixin, lazy
 from clld import interfaces
 
 from . import (
@@ -35,22 +37,25 @@ class Contribution(Base,
 
     date = Column(Date)
 
+    def _partitioned_contributors(self):
+        primary, secondary = [], []
+        for assoc in sorted(self.contributor_assocs, key=attrgetter('ord', 'contributor.id')):
+            (primary if assoc.primary else secondary).append(assoc.contributor)
+        return primary, secondary
+
     @property
     def primary_contributors(self):
-        return [assoc.contributor for assoc in
-                sorted(self.contributor_assocs,
-                       key=lambda a: (a.ord, a.contributor.id)) if assoc.primary]
+        return self._partitioned_contributors()[0]
 
     @property
     def secondary_contributors(self):
-        return [assoc.contributor for assoc in
-                sorted(self.contributor_assocs,
-                       key=lambda a: (a.ord, a.contributor.id)) if not assoc.primary]
+        return self._partitioned_contributors()[1]
 
     def formatted_contributors(self):
-        contribs = [' and '.join(c.name for c in self.primary_contributors)]
-        if self.secondary_contributors:
-            contribs.append(' and '.join(c.name for c in self.secondary_contributors))
+        primary, secondary = self._partitioned_contributors()
+        contribs = [' and '.join(c.name for c in primary)]
+        if secondary:
+            contribs.append(' and '.join(c.name for c in secondary))
         return ' with '.join(contribs)
 
 
@@ -73,7 +78,7 @@ class ContributionContributor(Base, PolymorphicBaseMixin):
     __table_args__ = (UniqueConstraint('contribution_pk', 'contributor_pk'),)
 
     contribution_pk = Column(Integer, ForeignKey('contribution.pk'), nullable=False)
-    contributor_pk = Column(Integer, ForeignKey('contributor.pk'), nullable=False)
+    contributor_pk = Column(Integer, ForeignKey('contributor.pk'), nullable=False, index=True)
 
     # contributors are ordered.
     ord = Column(Integer, default=1)
@@ -82,6 +87,11 @@ class ContributionContributor(Base, PolymorphicBaseMixin):
     primary = Column(Boolean, default=True)
 
     contribution = relationship(
-        Contribution, innerjoin=True, backref='contributor_assocs')
+        Contribution,
+        innerjoin=True,
+        backref=backref('contributor_assocs', order_by=ord, lazy='selectin'))
     contributor = relationship(
-        Contributor, innerjoin=True, lazy=False, backref='contribution_assocs')
+        Contributor,
+        innerjoin=True,
+        lazy=False,
+        backref=backref('contribution_assocs', lazy=lazy()))
@@ -83,7 +83,7 @@ class LanguageSource(Base):
     __table_args__ = (UniqueConstraint('language_pk', 'source_pk'),)
 
     language_pk = Column(Integer, ForeignKey('language.pk'), nullable=False)
-    source_pk = Column(Integer, ForeignKey('source.pk'), nullable=False)
+    source_pk = Column(Integer, ForeignKey('source.pk'), nullable=False, index=True)
 
 
 class IdentifierType(DeclEnum):
@@ -130,10 +130,10 @@ class LanguageIdentifier(Base):
     __table_args__ = (UniqueConstraint('language_pk', 'identifier_pk'),)
 
     language_pk = Column(Integer, ForeignKey('language.pk'), nullable=False)
-    identifier_pk = Column(Integer, ForeignKey('identifier.pk'), nullable=False)
+    identifier_pk = Column(Integer, ForeignKey('identifier.pk'), nullable=False, index=True)
     description = Column(Unicode)
 
-    identifier = relationship(Identifier, innerjoin=True)
+    identifier = relationship(Identifier, innerjoin=True, lazy='joined')
     language = relationship(
         Language, innerjoin=True,
-        backref=backref("languageidentifier", cascade="all, delete-orphan"))
+        backref=backref("languageidentifier", cascade="all, delete-orphan", lazy='selectin'))
@@ -76,6 +76,28 @@ class Parameter(Base,
     domain = relationship(
         'DomainElement', backref='parameter', order_by=DomainElement.number)
 
+    def languages_query(self, order_by=None, limit=None, offset=None):
+        """Query for the distinct languages which have a valueset for the parameter.
+
+        :param order_by: Optional column or SQL expression to order the languages by.
+        :param limit: Optional maximal number of languages to retrieve.
+        :param offset: Optional number of languages to skip.
+        :return: SQLAlchemy query.
+        """
+        from . import ValueSet
+
+        query = DBSession.query(Language)\
+            .join(ValueSet, ValueSet.language_pk == Language.pk)\
+            .filter(ValueSet.parameter_pk == self.pk)\
+            .distinct()
+        if order_by is not None:
+            query = query.order_by(order_by)
+        if limit is not None:
+            query = query.limit(limit)
+        if offset is not None:
+            query = query.offset(offset)
+        return query
+
 
 class CombinationDomainElement(object):
     def __init__(self, combination, domainelements, icon=None):
@@ -4,7 +4,7 @@ from sqlalchemy.ext.declarative import declared_attr
 
 from zope.interface import implementer
 
-from clld.db.meta import Base, PolymorphicBaseMixin
+from clld.db.meta import Base, PolymorphicBaseMixin, lazy
 from clld import interfaces
 
 from . import (
@@ -56,12 +56,12 @@ class Sentence(Base,
     markup_gloss = Column(Unicode)
     markup_comment = Column(Unicode)
 
-    language_pk = Column(Integer, ForeignKey('language.pk'))
+    language_pk = Column(Integer, ForeignKey('language.pk'), index=True)
 
     @declared_attr
     def language(cls):
         return relationship(
-            'Language', backref=backref('sentences', order_by=cls.language_pk))
+            'Language', backref=backref('sentences', order_by=cls.pk, lazy=lazy()))
 
     @property
     def audio(self):
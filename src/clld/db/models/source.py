@@ -112,21 +112,26 @@ class HasSourceMixin(object):
     key = Column(Unicode)  # the citation key, specific (and unique) within a contribution
     description = Column(Unicode)  # e.g. page numbers.
 
+    def __init_subclass__(cls, **kw):
+        cls._source_backref = cls.__name__.lower() + 's'
+        super().__init_subclass__(**kw)
+
     @declared_attr
     def source_pk(cls):  # pragma: no cover
-        return Column(Integer, ForeignKey('source.pk'))
+        return Column(Integer, ForeignKey('source.pk'), index=True)
 
     @declared_attr
     def source(cls):  # pragma: no cover
-        return relationship(Source, backref=cls.__name__.lower() + 's')
+        return relationship(Source, backref=cls._source_backref, lazy='joined')
 
 
 class HasSourceNotNullMixin(HasSourceMixin):
 
     @declared_attr
     def source_pk(cls):
-        return Column(Integer, ForeignKey('source.pk'), nullable=False)
+        return Column(Integer, ForeignKey('source.pk'), nullable=False, index=True)
 
     @declared_attr
     def source(cls):
-        return relationship(Source, innerjoin=True, backref=cls.__name__.lower() + 's')
+        return relationship(
+            Source, innerjoin=True, backref=cls._source_backref, lazy='joined')
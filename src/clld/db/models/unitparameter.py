@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 
 from zope.interface import implementer
@@ -31,6 +31,8 @@ class UnitDomainElement(Base,
     __table_args__ = (
         UniqueConstraint('unitparameter_pk', 'name'),
         UniqueConstraint('unitparameter_pk', 'ord'),
+        # backs retrieving the domain of a unitparameter ordered by id:
+        Index('ix_unitdomainelement_unitparameter_pk_id', 'unitparameter_pk', 'id'),
     )
 
     unitparameter_pk = Column(Integer, ForeignKey('unitparameter.pk'), nullable=False)
@@ -1,10 +1,11 @@
-from sqlalchemy import Column, Float, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Float, Integer, ForeignKey, UniqueConstraint, Index, inspect
 from sqlalchemy.orm import relationship, validates, backref
+from sqlalchemy.orm.base import NO_VALUE
 from sqlalchemy.ext.declarative import declared_attr
 
 from zope.interface import implementer
 
-from clld.db.meta import Base, PolymorphicBaseMixin
+from clld.db.meta import Base, PolymorphicBaseMixin, lazy
 from clld import interfaces
 
 from . import (
@@ -31,29 +32,33 @@ class UnitValue(Base,
                 HasDataMixin,
                 HasFilesMixin):
 
-    __table_args__ = (UniqueConstraint(
-        'unit_pk', 'unitparameter_pk', 'contribution_pk', 'name', 'unitdomainelement_pk'),
+    __table_args__ = (
+        UniqueConstraint(
+            'unit_pk', 'unitparameter_pk', 'contribution_pk', 'name', 'unitdomainelement_pk'),
+        Index('ix_unitvalue_unit_pk_pk', 'unit_pk', 'pk'),
     )
 
     unit_pk = Column(Integer, ForeignKey('unit.pk'), nullable=False)
-    unitparameter_pk = Column(Integer, ForeignKey('unitparameter.pk'), nullable=False)
-    contribution_pk = Column(Integer, ForeignKey('contribution.pk'))
+    unitparameter_pk = Column(
+        Integer, ForeignKey('unitparameter.pk'), nullable=False, index=True)
+    contribution_pk = Column(Integer, ForeignKey('contribution.pk'), index=True)
 
     # Values may be taken from a domain.
-    unitdomainelement_pk = Column(Integer, ForeignKey('unitdomainelement.pk'))
+    unitdomainelement_pk = Column(Integer, ForeignKey('unitdomainelement.pk'), index=True)
 
     # Languages may have multiple values for the same parameter. Their relative
     # frequency can be stored here.
     frequency = Column(Float)
 
-    unitparameter = relationship('UnitParameter', innerjoin=True, backref='unitvalues')
+    unitparameter = relationship(
+        'UnitParameter', innerjoin=True, backref=backref('unitvalues', lazy=lazy()))
     unitdomainelement = relationship('UnitDomainElement', backref='unitvalues')
     contribution = relationship('Contribution', backref='unitvalues')
 
     @declared_attr
     def unit(cls):
         return relationship(
-            'Unit', innerjoin=True, backref=backref('unitvalues', order_by=cls.unit_pk))
+            'Unit', innerjoin=True, backref=backref('unitvalues', order_by=cls.pk, lazy=lazy()))
 
     @validates('unitparameter_pk')
     def validate_parameter_pk(self, key, unitparameter_pk):
@@ -61,9 +66,15 @@ class UnitValue(Base,
 
         We have to make sure, the parameter a value is tied to and the parameter a
         possible domainelement is tied to stay in sync.
+
+        .. note::
+
+            Only an already loaded domainelement is checked, so that assigning
+            ``unitparameter_pk`` - e.g. in bulk imports - does not trigger a lazy load.
         """
-        if self.unitdomainelement and self.unitdomainelement.unitparameter_pk:
-            assert self.unitdomainelement.unitparameter_pk == unitparameter_pk
+        de = inspect(self).attrs.unitdomainelement.loaded_value
+        if de is not NO_VALUE and de is not None and de.unitparameter_pk:
+            assert de.unitparameter_pk == unitparameter_pk
         return unitparameter_pk
 
     def __str__(self):
@@ -11,7 +11,7 @@ from sqlalchemy.ext.declarative import declared_attr
 
 from zope.interface import implementer
 
-from clld.db.meta import Base, PolymorphicBaseMixin
+from clld.db.meta import Base, PolymorphicBaseMixin, lazy
 from clld import interfaces
 
 from . import (
@@ -49,7 +49,7 @@ class Value(Base,
     pk = Column(Integer, primary_key=True)
     valueset_pk = Column(Integer, ForeignKey('valueset.pk'), nullable=False)
     # Values may be taken from a domain.
-    domainelement_pk = Column(Integer, ForeignKey('domainelement.pk'))
+    domainelement_pk = Column(Integer, ForeignKey('domainelement.pk'), index=True)
 
     frequency = Column(
         Float,
@@ -66,7 +66,9 @@ class Value(Base,
         return relationship(
             ValueSet, innerjoin=True,
             backref=backref(
-                'values', order_by=[cls.frequency.desc(), cls.confidence, cls.pk]))
+                'values',
+                order_by=[cls.frequency.desc(), cls.confidence, cls.pk],
+                lazy=lazy()))
 
     def __json__(self, req):
         res = Base.__json__(self, req)
@@ -86,7 +88,7 @@ class ValueSentence(Base, PolymorphicBaseMixin):
     __table_args__ = (UniqueConstraint('value_pk', 'sentence_pk'),)
 
     value_pk = Column(Integer, ForeignKey('value.pk'), nullable=False)
-    sentence_pk = Column(Integer, ForeignKey('sentence.pk'), nullable=False)
+    sentence_pk = Column(Integer, ForeignKey('sentence.pk'), nullable=False, index=True)
     description = Column(Unicode())
 
     value = relationship(Value, innerjoin=True, backref='sentence_assocs')
@@ -1,10 +1,10 @@
-from sqlalchemy import Column, Integer, Unicode, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, Unicode, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import relationship, backref, joinedload
 from sqlalchemy.ext.declarative import declared_attr
 
 from zope.interface import implementer
 
-from clld.db.meta import Base, PolymorphicBaseMixin
+from clld.db.meta import Base, PolymorphicBaseMixin, lazy
 from clld import interfaces
 
 from . import (
@@ -36,14 +36,17 @@ class ValueSet(Base,
 
     __table_args__ = (
         UniqueConstraint('language_pk', 'parameter_pk', 'contribution_pk'),
+        Index('ix_valueset_language_pk_pk', 'language_pk', 'pk'),
+        Index('ix_valueset_parameter_pk_language_pk', 'parameter_pk', 'language_pk'),
     )
 
     language_pk = Column(Integer, ForeignKey('language.pk'), nullable=False)
     parameter_pk = Column(Integer, ForeignKey('parameter.pk'), nullable=False)
-    contribution_pk = Column(Integer, ForeignKey('contribution.pk'))
+    contribution_pk = Column(Integer, ForeignKey('contribution.pk'), index=True)
     source = Column(Unicode, doc='textual description of the source for the valueset')
 
-    parameter = relationship('Parameter', innerjoin=True, backref='valuesets')
+    parameter = relationship(
+        'Parameter', innerjoin=True, backref=backref('valuesets', lazy=lazy()))
 
     @staticmethod
     def refine_factory_query(query):
@@ -56,12 +59,15 @@ class ValueSet(Base,
     @declared_attr
     def contribution(cls):
         return relationship(
-            'Contribution', backref=backref('valuesets', order_by=cls.parameter_pk))
+            'Contribution',
+            backref=backref('valuesets', order_by=cls.parameter_pk, lazy=lazy()))
 
     @declared_attr
     def language(cls):
         return relationship(
-            'Language', innerjoin=True, backref=backref('valuesets', order_by=cls.language_pk))
+            'Language',
+            innerjoin=True,
+            backref=backref('valuesets', order_by=cls.pk, lazy=lazy()))
 
     @property
     def name(self):
@@ -2,8 +2,9 @@
 import re
 import time
 import functools
+import itertools
 
-from sqlalchemy import Integer
+from sqlalchemy import Integer, inspect
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.expression import cast
 import transaction
@@ -13,7 +14,7 @@ from clld.db.models import common
 
 __all__ = [
     'as_int', 'contains', 'icontains', 'compute_language_sources', 'compute_number_of_values',
-    'get_distinct_values', 'page_query']
+    'get_distinct_values', 'page_query', 'chunked_bulk_insert', 'bulk_insert_assocs']
 
 
 def as_int(col):
@@ -106,3 +107,61 @@ def page_query(q, n=1000, verbose=False, commit=False):
         s = e
         if not r:
             break
+
+
+def _with_polymorphic_identity(model, rows):
+    """Add the polymorphic identity of ``model`` - if any - to each row.
+
+    Bulk inserts bypass the ORM machinery which would otherwise set the discriminator.
+    """
+    mapper = inspect(model)
+    if mapper.polymorphic_on is None:
+        return rows
+    defaults = {mapper.polymorphic_on.key: mapper.polymorphic_identity}
+    return (dict(defaults, **row) for row in rows)
+
+
+def chunked_bulk_insert(model, rows, n=1000, session=None):
+    """Insert rows, given as ``dict``s of column values, in batches of ``n``.
+
+    Passing a huge list to ``Session.bulk_insert_mappings`` in one go keeps all the
+    parameter sets in memory at once; inserting in moderately sized batches bounds memory
+    use and is typically faster, too.
+
+    :param model: Model class to insert rows for.
+    :param rows: Iterable of ``dict``s, e.g. a generator.
+    :return: Number of inserted rows.
+    """
+    session = session or DBSession
+    rows, count = iter(_with_polymorphic_identity(model, rows)), 0
+    while True:
+        chunk = list(itertools.islice(rows, n))
+        if not chunk:
+            break
+        session.bulk_insert_mappings(model, chunk)
+        session.flush()
+        count += len(chunk)
+    return count
+
+
+def bulk_insert_assocs(model, rows, session=None):
+    """Insert rows into an association table, bypassing the ORM unit of work.
+
+    Association models like ``ContributionContributor`` or ``ValueSentence`` are plain
+    join rows, so we can insert them with one ``executemany`` of a Core ``INSERT``.
+    (With psycopg2, SQLAlchemy turns this into batched multi-row ``INSERT ... VALUES``.)
+
+    .. note::
+
+        Only the table of ``model`` is written, so this does not work for joined table
+        inheritance subclasses.
+
+    :param model: Model class of the association table.
+    :param rows: Iterable of ``dict``s of column values, typically foreign keys.
+    :return: Number of inserted rows.
+    """
+    session = session or DBSession
+    rows = list(_with_polymorphic_identity(model, rows))
+    if rows:
+        session.execute(model.__table__.insert(), rows)
+    return len(rows)
@@ -383,7 +383,7 @@ class Database(_Convertable):
     def keymap(self):
         """Map bibtex record ids to list index."""
         if self._keymap is None:
-            self._keymap = dict((r.id, i) for i, r in enumerate(self.records))
+            self._keymap = {r.id: i for i, r in enumerate(self.records)}
         return self._keymap
 
     @classmethod
@@ -9,7 +9,7 @@ import collections
 import urllib.parse
 
 from sqlalchemy import engine_from_config
-from sqlalchemy.orm import joinedload, undefer
+from sqlalchemy.orm import joinedload, undefer, configure_mappers
 from sqlalchemy.exc import NoResultFound
 
 from webob.request import Request as WebobRequest
@@ -45,10 +45,25 @@ from clld.web.maps import Map, ParameterMap, LanguageMap, CombinationMap
 from clld.web.icon import ICONS, MapMarker
 from clld.web import assets
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 assert clld
 assert assets
 
 
+def _orjson_dumps(value, **kw):
+    """Serializer for the "orjson" renderer, used for datatables if enabled in the settings.
+
+    Adapters registered with the renderer - and `__json__` methods - are still honoured,
+    because pyramid passes them in as `default`.
+    """
+    return orjson.dumps(
+        value, default=kw.get('default'), option=orjson.OPT_NON_STR_KEYS).decode('utf8')
+
+
 class ClldRequest(Request):
 
     """Custom Request class."""
@@ -495,6 +510,16 @@ def includeme(config):
     json_renderer.add_adapter(datetime.date, lambda obj, req: obj.isoformat())
     config.add_renderer('json', json_renderer)
 
+    if asbool(config.registry.settings.get('clld.datatables_orjson')):
+        # Opt-in: Serialize the - potentially big - datatables responses with orjson.
+        if orjson is None:  # pragma: no cover
+            raise ValueError(
+                'clld.datatables_orjson requires orjson, install clld[orjson]')
+        orjson_renderer = JSON(serializer=_orjson_dumps)
+        orjson_renderer.add_adapter(datetime.datetime, lambda obj, req: obj.isoformat())
+        orjson_renderer.add_adapter(datetime.date, lambda obj, req: obj.isoformat())
+        config.add_renderer('orjson', orjson_renderer)
+
     jsonp_renderer = JSONP(param_name='callback')
     jsonp_renderer.add_adapter(datetime.datetime, lambda obj, req: obj.isoformat())
     jsonp_renderer.add_adapter(datetime.date, lambda obj, req: obj.isoformat())
@@ -508,6 +533,9 @@ def includeme(config):
     engine = engine_from_config(config.registry.settings, 'sqlalchemy.')
     DBSession.configure(bind=engine)
     Base.metadata.bind = engine
+    # Configure the mappers - including the ones of app-specific models - when the app is
+    # created, rather than when the first request hits the database:
+    config.action(None, configure_mappers)
 
     try:
         git_tag = git_describe(pathlib.Path(pkg_dir).parent)
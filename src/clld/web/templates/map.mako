@@ -4,7 +4,7 @@
     ${obj.legend()}
     % endif
     <div id="${obj.eid}" style="position: relative; width: 100%; height: 200px;"> </div>
-    <script>$(window).load(function() {${h.JS_CLLD.map(obj.eid, dict((l.id, l.data) for l in obj.layers), obj.options)|n};});</script>
+    <script>$(window).load(function() {${h.JS_CLLD.map(obj.eid, {l.id: l.data for l in obj.layers}, obj.options)|n};});</script>
 </div>
 % else:
 <div class="well well-small" id="map-container">
@@ -24,7 +24,7 @@
     <div id="${obj.eid}" style="width: 100%; height: ${obj.options.get('height', 500)}px;"> </div>
     <script>
     $(window).load(function() {
-        ${h.JS_CLLD.map(obj.eid, dict((l.id, l.data) for l in obj.layers), obj.options)|n};
+        ${h.JS_CLLD.map(obj.eid, {l.id: l.data for l in obj.layers}, obj.options)|n};
     });
     $('.dropdown-menu .stay-open').click(function(e) {
         e.stopPropagation();
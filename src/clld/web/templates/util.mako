@@ -283,7 +283,7 @@ $(document).ready(function() {
 
 <%def name="md_tabs()">
     <% format = request.params.get('format', 'md.txt') %>
-    <% adapters = dict((a.extension, a) for n, a in h.get_adapters(h.interfaces.IMetadata, ctx, request)) %>
+    <% adapters = {a.extension: a for n, a in h.get_adapters(h.interfaces.IMetadata, ctx, request)} %>
 
     <ul class="nav nav-tabs">
     % for fmt in ['md.txt', 'md.bib', 'md.ris']:
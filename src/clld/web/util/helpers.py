@@ -380,7 +380,7 @@ def rendered_sentence(sentence, abbrs=None, fmt='long'):
             or_(models.GlossAbbreviation.language_pk == sentence.language_pk,
                 models.GlossAbbreviation.language_pk == None)
         )
-        abbrs = dict((g.id, g.name) for g in q)
+        abbrs = {g.id: g.name for g in q}
 
     def gloss_with_tooltip(gloss):
         person_map = {
@@ -7,6 +7,7 @@ from pyramid.response import Response
 import pyramid.httpexceptions
 from pyramid.interfaces import IRoutesMapper
 from pyramid.renderers import render, render_to_response
+from pyramid.settings import asbool
 
 from clld.interfaces import IRepresentation, IIndex, IMetadata
 from clld.web.adapters import get_adapter, get_adapters
@@ -73,20 +74,25 @@ def _add_link_header(response, url, adapter=None, rel="canonical", mimetype="tex
             ('Link', '<%s>; rel="%s"; type="%s"' % tuple(map(str, [url, rel, mimetype]))))
 
 
+def _linkable_adapters(adapters):
+    """Adapters for which alternate representations can be advertised in Link headers."""
+    return [a for a in adapters if a.rel and a.extension]
+
+
 def index_view(ctx, req):
     if req.is_xhr and 'sEcho' in req.params:
         return datatable_xhr_view(ctx, req)
     res, current, adapters = view(IIndex, ctx, req, getadapters=True)
     if req.matched_route:
-        if req.matched_route.name.endswith('_alt'):
+        route_name = req.matched_route.name
+        if route_name.endswith('_alt'):
             # add the canonical link:
-            _add_link_header(res, req.route_url(req.matched_route.name[:-4]))
+            _add_link_header(res, req.route_url(route_name[:-4]))
         else:
-            for a in [_a for _a in adapters if _a.rel and _a.extension]:
+            alt_route_name = route_name + '_alt'
+            for a in _linkable_adapters(adapters):
                 _add_link_header(
-                    res,
-                    req.route_url(req.matched_route.name + '_alt', ext=a.extension),
-                    adapter=a)
+                    res, req.route_url(alt_route_name, ext=a.extension), adapter=a)
     return res
 
 
@@ -96,28 +102,27 @@ def resource_view(ctx, req):
         if req.matched_route.name.endswith('_alt'):
             _add_link_header(res, req.resource_url(ctx))
         else:
-            for a in adapters:
-                if a.rel and a.extension:
-                    _add_link_header(
-                        res, req.resource_url(ctx, ext=a.extension), adapter=a)
+            for a in _linkable_adapters(adapters):
+                _add_link_header(res, req.resource_url(ctx, ext=a.extension), adapter=a)
     return res
 
 
 def datatable_xhr_view(ctx, req):
     # call get_query, thereby - as side effect - making sure, the counts are set.
     items = ctx.get_query()
+    formatters = [(str(i), col.format) for i, col in enumerate(ctx.cols)]
     if hasattr(ctx, 'row_class'):
+        row_class = ctx.row_class
         data = []
         for item in items:
-            _d = {'DT_RowId': 'row_%s' % item.pk}
-            row_class = ctx.row_class(item)
-            if row_class:
-                _d['DT_RowClass'] = row_class
-            for i, col in enumerate(ctx.cols):
-                _d[str(i)] = col.format(item)
+            _d = {k: fmt(item) for k, fmt in formatters}
+            _d['DT_RowId'] = 'row_%s' % item.pk
+            rc = row_class(item)
+            if rc:
+                _d['DT_RowClass'] = rc
             data.append(_d)
     else:
-        data = [[col.format(item) for col in ctx.cols] for item in items]
+        data = [[fmt(item) for _, fmt in formatters] for item in items]
 
     # sEcho parameter.
     # Note that it strongly recommended for security reasons that you 'cast' this
@@ -133,19 +138,42 @@ def datatable_xhr_view(ctx, req):
         "iTotalRecords": ctx.count_all,
         "iTotalDisplayRecords": ctx.count_filtered,
     }
-    return render_to_response('json', res, request=req)
+    renderer = 'json'
+    if asbool(req.registry.settings.get('clld.datatables_orjson')):
+        renderer = 'orjson'
+    return render_to_response(renderer, res, request=req)
 
 
-def js(req):
-    param_pattern = re.compile(r'\{(?P<name>[a-z]+)(\:[^\}]+)?\}')
+# Route patterns may specify regular expressions for placeholders, e.g. "{id:[a-z]+}",
+# which we strip for use in JavaScript.
+_PARAM_PATTERN = re.compile(r'\{(?P<name>[a-z]+)(\:[^\}]+)?\}')
+
+
+def _js_routes(registry):
+    """JavaScript code registering the URL patterns of all routes of an app.
 
+    The routes of an app are fixed once the app is created, so the code is computed only
+    once and cached on the registry.
+    """
+    try:
+        return registry._clld_js_routes
+    except AttributeError:
+        registry._clld_js_routes = '\n'.join(
+            'CLLD.routes[%s] = %s;' % (
+                json.dumps(route.name),
+                json.dumps(_PARAM_PATTERN.sub(r'{\g<name>}', route.pattern)))
+            for route in registry.getUtility(IRoutesMapper).get_routes())
+        return registry._clld_js_routes
+
+
+def js(req):
     res = [
         "CLLD.base_url = %s;" % json.dumps(req.application_url),
         "CLLD.query_params = %s;" % json.dumps(req.query_params),
     ]
-    for route in req.registry.getUtility(IRoutesMapper).get_routes():
-        pattern = param_pattern.sub(lambda m: '{%s}' % m.group('name'), route.pattern)
-        res.append('CLLD.routes[%s] = %s;' % tuple(map(json.dumps, [route.name, pattern])))
+    routes = _js_routes(req.registry)
+    if routes:
+        res.append(routes)
     return Response('\n'.join(res), content_type="text/javascript")
 
 
@@ -210,19 +238,32 @@ def unapi(req):
 # The following code implements a view to show a map with parameters from distinct
 # datasets. It may be used by CrossGram at some point.
 #
+def _parameter_select_data(registry):  # pragma: no cover
+    """Select options for the parameters listed in the "clld.parameters" setting.
+
+    Since the settings do not change once the app is running, the options are computed
+    only once and cached on the registry.
+    """
+    try:
+        return registry._clld_parameter_select_data
+    except AttributeError:
+        data = []
+        for app, rm in registry.settings.get('clld.parameters', {}).items():
+            for param in rm['resources']:
+                data.append({
+                    'id': '%s-%s' % (app, param['id']),
+                    'text': '%s %s: %s' % (app, param['id'], param['name'])})
+        registry._clld_parameter_select_data = (data, {d['id']: d for d in data})
+        return registry._clld_parameter_select_data
+
+
 class ParameterMultiSelect(MultiSelect):  # pragma: no cover
 
     """Experimental."""
 
     def __init__(self, req, name, eid, collection=None, url=None, selected=None):
         MultiSelect.__init__(self, req, name, eid, url='x')
-        self.data = []
-        for app, rm in req.registry.settings.get('clld.parameters', {}).items():
-            for param in rm['resources']:
-                self.data.append({
-                    'id': '%s-%s' % (app, param['id']),
-                    'text': '%s %s: %s' % (app, param['id'], param['name'])})
-        self._datadict = dict((d['id'], d) for d in self.data)
+        self.data, self._datadict = _parameter_select_data(req.registry)
 
     def format_result(self, obj):
         return obj
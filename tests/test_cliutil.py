@@ -22,6 +22,8 @@ def test_bibtex2source():
     bibtex2source(Record('book', 'id', editor='M, R and G, H'))
     bibtex2source(Record('book', 'id', title='tb', customfield='cf', year="1920}"))
     assert bibtex2source(Record('misc', 'Id', title='title')).id == 'Id'
+    src = bibtex2source(Record('book', 'id', title='t', customfield='cf', annote='a'))
+    assert src.title == 't' and src.jsondata == {'annote': 'a'}
 
 
 def test_Data(mocker):
@@ -31,9 +33,29 @@ def test_Data(mocker):
     d.add(Language, 'l', id='l', name='l')
     assert session
     d.add(Language, 'l2', _obj=5)
+    d.add(Language, None, id='l6', name='l6')
+    assert None not in d['Language']
+    d = Data(name='default')
+    assert d.add(Language, 'l4', id='l4').name == 'default'
+    assert d.add(Language, 'l5', id='l5', name='l5').name == 'l5'
     with pytest.raises(ValueError):
         d.add(Language, 'l3', id='l.3')
 
 
+def test_Data_buffered(mocker):
+    session = mocker.Mock()
+    mocker.patch('clld.cliutil.DBSession', session)
+    d = Data(buffer_size=2)
+    d.add(Language, 'l', id='l', name='l')
+    assert not session.add_all.called
+    d.add(Language, 'l2', id='l2', name='l2')
+    assert session.add_all.call_count == 1 and session.flush.call_count == 1
+    d.add(Language, 'l3', id='l3', name='l3')
+    d.flush()
+    assert session.add_all.call_count == 2
+    assert len(d['Language']) == 3
+    assert not session.add.called
+
+
 def test_add_language_codes(env):
     add_language_codes(Data(), Language(), 'iso', glottocodes=dict(iso='glot1234'))
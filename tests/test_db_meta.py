@@ -60,3 +60,11 @@ def test_Base_get(db):
     assert 42 == Language.get('doesntexist', default=42)
     with pytest.raises(NoResultFound):
         Language.get('doesntexist')
+
+
+def test_lazy(mocker):
+    from clld.db import meta
+
+    assert meta.lazy('selectin') == 'selectin'
+    mocker.patch.object(meta, 'STRICT_LOADS', True)
+    assert meta.lazy() == 'raise'
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from sqlalchemy import inspect
+
 from clld.db.meta import DBSession
 from clld.db.models import common
 
@@ -108,6 +110,11 @@ def test_UnitValue(db, persist):
     v.unitparameter_pk = p1.pk
     DBSession.flush()
 
+    # The validator must not lazy-load the domainelement:
+    DBSession.expire(v)
+    v.unitparameter_pk = p2.pk
+    assert 'unitdomainelement' in inspect(v).unloaded
+
 
 def test_Identifier():
     i = common.Identifier(id='a', name='a', type=common.IdentifierType.iso.value)
@@ -120,11 +127,32 @@ def test_Contribution(data):
     c = DBSession.query(common.Contribution).first()
     assert c.formatted_contributors()
 
+    c = common.Contribution(id='c', name='c')
+    DBSession.add(c)
+    c.contributor_assocs.append(common.ContributionContributor(
+        contributor=common.Contributor(id='ca', name='A'), ord=1))
+    DBSession.flush()
+    assert [co.id for co in c.primary_contributors] == ['ca']
+    c.contributor_assocs.append(common.ContributionContributor(
+        contributor=common.Contributor(id='cb', name='B'), ord=2, primary=False))
+    DBSession.flush()
+    assert [co.id for co in c.primary_contributors] == ['ca']
+    assert [co.id for co in c.secondary_contributors] == ['cb']
+    assert c.formatted_contributors() == 'A with B'
+
 
 def test_Value(data):
     assert 'valueset' in common.Value.first().__json__(None)
 
 
+def test_Parameter(data):
+    p = common.Parameter.get('parameter')
+    assert [lg.id for lg in p.languages_query()] == ['language']
+    # GeoJson.feature_iterator relies on `languages` to detect collections of languages:
+    assert not hasattr(p, 'languages')
+    assert p.languages_query(order_by=common.Language.name, limit=1, offset=1).all() == []
+
+
 def test_Combination(data):
     p = common.Parameter.first()
     c = common.Combination.get(common.Combination.delimiter.join(2 * [p.id]))
@@ -21,3 +21,34 @@ def test_icontains(data):
     for qs, count in [('Se', 1), ('^d$', 0), ('^d', 1), ('setä$', 1), ('\\\\b', 0)]:
         q = DBSession.query(Dataset).filter(icontains(Dataset.name, qs))
         assert q.count() == count
+
+
+def test_chunked_bulk_insert(db):
+    from clld.db.util import chunked_bulk_insert
+    from clld.db.models.common import Identifier, Language
+    from clld.db.meta import DBSession
+
+    rows = ({'id': str(i), 'name': str(i), 'type': 'name'} for i in range(25))
+    assert chunked_bulk_insert(Identifier, rows, n=10) == 25
+    assert DBSession.query(Identifier).count() == 25
+
+    rows = ({'id': 'l%s' % i, 'name': str(i)} for i in range(5))
+    assert chunked_bulk_insert(Language, rows, n=2) == 5
+    assert len(DBSession.query(Language).all()) == 5
+
+
+def test_bulk_insert_assocs(data):
+    from clld.db.util import bulk_insert_assocs
+    from clld.db.models.common import Contribution, Contributor, ContributionContributor
+    from clld.db.meta import DBSession
+
+    contrib = Contribution(id='c2', name='c2')
+    DBSession.add(contrib)
+    DBSession.flush()
+    rows = [
+        {'contribution_pk': contrib.pk, 'contributor_pk': c.pk, 'ord': i}
+        for i, c in enumerate(DBSession.query(Contributor).order_by(Contributor.pk))]
+    assert bulk_insert_assocs(ContributionContributor, rows) == len(rows)
+    assert bulk_insert_assocs(ContributionContributor, []) == 0
+    DBSession.expire(contrib)
+    assert len(contrib.primary_contributors) == len(rows)
@@ -117,3 +117,29 @@ def test_includeme_error(tmp_path, capsys):
     out, err = capsys.readouterr()
     assert 'failingapp.util' in out
     sys.path.pop()
+
+
+def test_orjson_dumps():
+    import decimal
+    from pyramid.renderers import JSON
+    from clld.web.app import _orjson_dumps
+
+    class Obj:
+        def __json__(self, req):
+            return {1: 'x'}
+
+    renderer = JSON(serializer=_orjson_dumps)
+    renderer.add_adapter(decimal.Decimal, lambda obj, req: str(obj))
+    render = renderer(None)
+    assert render([Obj(), decimal.Decimal('1.5')], {}) == '[{"1":"x"},"1.5"]'
+
+
+def test_datatables_orjson():
+    from pyramid.interfaces import IRendererFactory
+
+    config = Configurator(
+        root_package=importlib.import_module('clld.web'),
+        settings={'sqlalchemy.url': 'sqlite://', 'clld.datatables_orjson': 'true'})
+    config.include('clld.web.app')
+    config.commit()
+    assert config.registry.queryUtility(IRendererFactory, name='orjson')
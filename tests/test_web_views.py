@@ -49,6 +49,23 @@ def test_index_view(env, request_factory, ctx_cls, model, req_props, content_typ
             assert res.content_type == content_type
 
 
+def test_datatable_xhr_view_orjson(env, request_factory, mocker):
+    from pyramid.interfaces import IRendererFactory
+    from pyramid.renderers import JSON
+    from clld.web.app import _orjson_dumps
+    from clld.web.views import datatable_xhr_view
+
+    renderer = JSON(serializer=_orjson_dumps)
+    mocker.patch.dict(env['registry'].settings, {'clld.datatables_orjson': 'true'})
+    env['registry'].registerUtility(renderer, IRendererFactory, name='orjson')
+    spy = mocker.spy(renderer, 'serializer')
+    dt = env['registry'].getUtility(IDataTable, name='contributors')
+    with request_factory(is_xhr=True, params={'sEcho': '1'}) as req:
+        res = datatable_xhr_view(dt(req, common.Contributor), req)
+        assert res.json['sEcho'] == '1'
+        assert spy.called
+
+
 def test_resource_view(env, request_factory):
     from clld.web.views import resource_view
 
@@ -94,7 +111,8 @@ def test__ping(env):
 def test_js(env):
     from clld.web.views import js
 
-    js(env['request'])
+    res = js(env['request'])
+    assert 'CLLD.routes["language"] = "/languages/{id}"' in res.text
 
 
 def test_gone(env):